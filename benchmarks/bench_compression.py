@@ -0,0 +1,158 @@
+"""
+Mesure ce que coûtent et rapportent la minification HTML et la compression des réponses : crée
+un projet avec --compression brotli --minify-html dans un dossier temporaire, y importe N articles
+(tous affichés sur la première page de la liste), puis récupère quelques pages sans compression
+et les fait passer par les middlewares de core/compression.py.
+
+Pour chaque page et chaque variante (sans compression, gzip, brotli à plusieurs qualités, avec
+ou sans minification), le rapport donne les octets envoyés, le temps CPU des middlewares par
+réponse et le temps de transfert à --link-mbps, pour comparer les deux.
+
+Usage :
+    python benchmarks/bench_compression.py --posts 1000 --qualities 1 5 11 --output compression.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from bench_serve import seed_posts
+from common import PROJECT_NAME, environment, prepare_work_dir, scaffold, split_script_options, venv_python, write_report
+
+# Programme exécuté par l'interpréteur du projet : reçoit la configuration en JSON (argv[1]),
+# écrit les résultats en JSON sur la sortie standard
+MEASURE_SOURCE = r"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.getcwd())
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import Client, RequestFactory
+from django.test.utils import override_settings
+
+from core.compression import CompressionMiddleware, HtmlMinifyMiddleware
+
+config = json.loads(sys.argv[1])
+uncompressed_middleware = [name for name in settings.MIDDLEWARE if not name.startswith('core.compression.')]
+client = Client(HTTP_HOST='127.0.0.1')
+minifier = HtmlMinifyMiddleware(lambda request: None)
+
+
+def fetch(path):
+    with override_settings(MIDDLEWARE=uncompressed_middleware):
+        response = client.get(path)
+    content = b''.join(response.streaming_content) if response.streaming else response.content
+    return content, response['Content-Type']
+
+
+def compressor(encodings, quality):
+    with override_settings(COMPRESSION_ENCODINGS=encodings, COMPRESSION_BROTLI_QUALITY=quality):
+        return CompressionMiddleware(lambda request: None)
+
+
+def measure(path, content, content_type, minify, encoding, middleware):
+    request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING=encoding or '')
+    timings = []
+    for _ in range(config['repeat']):
+        response = HttpResponse(content, content_type=content_type)
+        start = time.perf_counter()
+        if minify:
+            response = minifier.process_response(request, response)
+        if middleware is not None:
+            response = middleware.process_response(request, response)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        'bytes': len(response.content),
+        'content_encoding': response.get('Content-Encoding'),
+        'cpu_ms': timings[len(timings) // 2] * 1000,
+    }
+
+
+variants = [('identity', None, None), ('gzip', 'gzip', compressor(['gzip'], None))]
+variants += [(f'br-{quality}', 'br', compressor(['br'], quality)) for quality in config['qualities']]
+results = []
+for page, path in config['pages'].items():
+    content, content_type = fetch(path)
+    for minify in ((False, True) if content_type.startswith('text/html') else (False,)):
+        for name, encoding, middleware in variants:
+            result = measure(path, content, content_type, minify, encoding, middleware)
+            results.append({'page': page, 'path': path, 'uncompressed_bytes': len(content), 'minify': minify,
+                            'variant': name, **result})
+
+print(json.dumps(results))
+"""
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Measure bytes on the wire and CPU time of HTML minification "
+                                                 "and response compression.",
+                                     epilog="Arguments after -- are passed to create_django_project.py.")
+    parser.add_argument('--posts', type=int, default=1000,
+                        help="number of posts, all shown on the first page of the posts list (default: 1000)")
+    parser.add_argument('--qualities', type=int, nargs='+', default=[1, 5, 11],
+                        help="brotli qualities to compare (default: 1 5 11)")
+    parser.add_argument('--repeat', type=int, default=50, help="responses measured per variant (default: 50)")
+    parser.add_argument('--link-mbps', type=float, default=10,
+                        help="link speed used to estimate the transfer time (default: 10 Mbit/s)")
+    parser.add_argument('--output', help="JSON report file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    own_args, options = split_script_options(sys.argv[1:] if argv is None else argv)
+    args = parse_args(own_args)
+    replaced = ('--compression', '--minify-html', '--page-size')
+    kept = []
+    for option in options:
+        if kept and kept[-1] in ('--compression', '--page-size'):
+            kept.pop()
+        elif not option.startswith(replaced):
+            kept.append(option)
+    options = kept + ['--compression', 'brotli', '--minify-html', '--page-size', str(args.posts)]
+
+    with tempfile.TemporaryDirectory(prefix='djangoflow-bench-') as work_dir:
+        prepare_work_dir(work_dir)
+        scaffold(work_dir, options)
+        project_dir = os.path.join(work_dir, PROJECT_NAME)
+        seed_posts(project_dir, 0, args.posts)
+
+        config = {
+            'pages': {'home': '/', 'posts_list': '/posts/', 'post_page': '/posts/bench-0/',
+                      'sitemap': '/sitemap.xml'},
+            'qualities': args.qualities,
+            'repeat': args.repeat,
+        }
+        result = subprocess.run([venv_python(project_dir), '-c', MEASURE_SOURCE, json.dumps(config)], cwd=project_dir,
+                                stdout=subprocess.PIPE, text=True, check=True)
+        results = json.loads(result.stdout)
+
+    for result in results:
+        result['transfer_ms'] = result['bytes'] * 8 / (args.link_mbps * 1000)
+        print(f"  {result['page']:<11} {'minified' if result['minify'] else 'raw':<9} {result['variant']:<9}"
+              f"{result['bytes']:>9} B  cpu {result['cpu_ms']:7.2f} ms  "
+              f"transfer {result['transfer_ms']:8.2f} ms", file=sys.stderr)
+
+    write_report({
+        'benchmark': 'compression',
+        'environment': environment(),
+        'options': options,
+        'posts': args.posts,
+        'link_mbps': args.link_mbps,
+        'repeat': args.repeat,
+        'results': results,
+    }, args.output)
+
+
+if __name__ == '__main__':
+    main()
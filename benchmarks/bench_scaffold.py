@@ -0,0 +1,85 @@
+"""
+Mesure create_django_project.py de bout en bout, étape par étape, dans un dossier temporaire :
+
+- cold : cache de paquets vide, tout est téléchargé (accès à l'index PyPI nécessaire)
+- warm : cache de paquets rempli, nouveau projet
+- rerun : relance sur le projet existant, aucune entrée n'a changé
+
+Usage :
+    python benchmarks/bench_scaffold.py --runs 3 --output scaffold.json -- --search --async
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from common import PROJECT_NAME, environment, median, prepare_work_dir, scaffold, split_script_options, write_report
+
+SCENARIOS = ['cold', 'warm', 'rerun']
+
+
+def run_scenario(name, work_dir, cache_dir, options):
+    """Une exécution du script ; cold et warm partent d'un dossier de projet vide."""
+    if name != 'rerun':
+        shutil.rmtree(os.path.join(work_dir, PROJECT_NAME), ignore_errors=True)
+    timings_file = os.path.join(work_dir, f'{name}-timings.json')
+    elapsed = scaffold(work_dir, options, cache_dir=cache_dir, timings_file=timings_file)
+    with open(timings_file) as file:
+        timings = json.load(file)
+    return {'elapsed': elapsed, **timings}
+
+
+def summarize(runs):
+    step_names = {name for run in runs for name in run['steps']}
+    return {
+        'median_elapsed': median([run['elapsed'] for run in runs]),
+        'median_wall_time': median([run['wall_time'] for run in runs]),
+        'median_steps': {
+            name: median([run['steps'][name]['duration'] for run in runs if name in run['steps']])
+            for name in sorted(step_names)
+        },
+        'runs': runs,
+    }
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Time each scaffold step with cold and warm package caches.",
+                                     epilog="Arguments after -- are passed to create_django_project.py.")
+    parser.add_argument('--runs', type=int, default=1, help="runs of each scenario (default: 1)")
+    parser.add_argument('--skip-cold', action='store_true',
+                        help="skip the cold scenario, which downloads every package")
+    parser.add_argument('--cache-dir',
+                        help="package cache of the warm and rerun scenarios when --skip-cold is given "
+                             "(default: DJANGOFLOW_CACHE_DIR or ~/.cache/djangoflow)")
+    parser.add_argument('--output', help="JSON report file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    own_args, options = split_script_options(sys.argv[1:] if argv is None else argv)
+    args = parse_args(own_args)
+    scenarios = SCENARIOS[1:] if args.skip_cold else SCENARIOS
+    results = {name: [] for name in scenarios}
+
+    for run in range(args.runs):
+        with tempfile.TemporaryDirectory(prefix='djangoflow-bench-') as work_dir:
+            prepare_work_dir(work_dir)
+            # Sans --skip-cold, chaque exécution part d'un cache vide qui est ensuite réutilisé tel quel
+            cache_dir = args.cache_dir if args.skip_cold else os.path.join(work_dir, 'package-cache')
+            for name in scenarios:
+                result = run_scenario(name, work_dir, cache_dir, options)
+                results[name].append(result)
+                print(f"run {run + 1}/{args.runs} {name:<5} {result['elapsed']:7.2f}s", file=sys.stderr)
+
+    write_report({
+        'benchmark': 'scaffold',
+        'environment': environment(),
+        'options': options,
+        'scenarios': {name: summarize(runs) for name, runs in results.items()},
+    }, args.output)
+
+
+if __name__ == '__main__':
+    main()
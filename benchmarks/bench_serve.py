@@ -0,0 +1,235 @@
+"""
+Charge un projet généré : crée le projet dans un dossier temporaire (avec --instrumentation,
+dont l'en-tête Server-Timing donne le nombre de requêtes SQL), y importe N articles, démarre
+le serveur puis envoie des requêtes en parallèle sur chaque route pendant une durée fixe.
+Le rapport donne par route le débit, les latences p50/p99 et les requêtes SQL par requête.
+
+Les tailles sont cumulatives : le même projet passe de 1 000 à 100 000 articles, etc.
+Le serveur est gunicorn (gunicorn.conf.py) pour les projets --async, runserver sinon.
+
+Usage :
+    python benchmarks/bench_serve.py --posts 1000 100000 --duration 10 --output serve.json -- --search
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from common import PROJECT_NAME, environment, prepare_work_dir, scaffold, split_script_options, venv_python, write_report
+
+WORDS = ('django', 'python', 'cache', 'index', 'query', 'template', 'async', 'worker', 'server', 'static',
+         'sqlite', 'postgres', 'search', 'feed', 'sitemap', 'pagination', 'cursor', 'model', 'view', 'route')
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+SERVER_START_TIMEOUT = 60
+
+
+def post_rows(start, stop, seed=0):
+    """Articles bench-<i> déterministes, un par minute en remontant depuis le 1er janvier 2024."""
+    rng = random.Random(seed + start)
+    origin = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(start, stop):
+        yield {
+            'title': f"{' '.join(rng.choices(WORDS, k=3)).capitalize()} {i}",
+            'slug': f"bench-{i}",
+            'body': ' '.join(rng.choices(WORDS, k=80)),
+            'date': (origin - timedelta(minutes=i)).isoformat(),
+        }
+
+
+def seed_posts(project_dir, start, stop):
+    """Importe les articles start..stop-1 avec la commande import_posts du projet, en flux sur stdin."""
+    started = time.perf_counter()
+    process = subprocess.Popen([venv_python(project_dir), 'manage.py', 'import_posts', '-', '--batch-size', '2000'],
+                               cwd=project_dir, stdin=subprocess.PIPE, text=True)
+    for row in post_rows(start, stop):
+        process.stdin.write(json.dumps(row) + '\n')
+    process.stdin.close()
+    if process.wait():
+        raise RuntimeError(f"import_posts exited with status {process.returncode}")
+    return time.perf_counter() - started
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(project_dir, port, log):
+    """Démarre le serveur et attend qu'il réponde ; renvoie (processus, nom du serveur)."""
+    gunicorn = os.path.join(project_dir, '.venv', 'bin', 'gunicorn')
+    env = dict(os.environ, GUNICORN_BIND=f'127.0.0.1:{port}')
+    if os.path.exists(gunicorn) and os.path.exists(os.path.join(project_dir, 'gunicorn.conf.py')):
+        name, command = 'gunicorn', [gunicorn, '-c', 'gunicorn.conf.py', 'core.asgi:application']
+    else:
+        name, command = 'runserver', [venv_python(project_dir), 'manage.py', 'runserver', '--noreload',
+                                      f'127.0.0.1:{port}']
+    process = subprocess.Popen(command, cwd=project_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{name} exited with status {process.returncode}, see {log.name}")
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.request('GET', '/about/')
+            if connection.getresponse().status == 200:
+                return process, name
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{name} did not answer within {SERVER_START_TIMEOUT}s, see {log.name}")
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, round(p / 100 * (len(sorted_values) - 1)))]
+
+
+def load(port, next_path, duration, concurrency, keep_alive=True):
+    """
+    Envoie des requêtes GET pendant ``duration`` secondes depuis ``concurrency`` clients,
+    chacun attendant sa réponse avant la requête suivante.
+
+    :param next_path: Fonction qui reçoit un ``random.Random`` et renvoie le chemin à demander
+    :param keep_alive: Réutilise la connexion ; sinon une connexion par requête
+    """
+    deadline = time.perf_counter() + duration
+    headers = {} if keep_alive else {'Connection': 'close'}
+
+    def client(seed):
+        rng = random.Random(seed)
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        latencies, queries, errors = [], [], 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                connection.request('GET', next_path(rng), headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if not keep_alive:
+                    connection.close()
+            except (OSError, http.client.HTTPException):
+                errors += 1
+                connection.close()
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.status >= 400:
+                errors += 1
+            match = SERVER_TIMING_QUERIES.search(response.getheader('Server-Timing') or '')
+            if match:
+                queries.append(int(match.group(1)))
+        connection.close()
+        return latencies, queries, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        outcomes = list(executor.map(client, range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for outcome in outcomes for latency in outcome[0])
+    queries = [count for outcome in outcomes for count in outcome[1]]
+    return {
+        'requests': len(latencies),
+        'errors': sum(outcome[2] for outcome in outcomes),
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000 if latencies else None,
+        'p99_ms': percentile(latencies, 99) * 1000 if latencies else None,
+        'queries_per_request': sum(queries) / len(queries) if queries else None,
+    }
+
+
+def routes(posts, options):
+    """Chemins demandés pour chaque route, tirés au hasard parmi les articles importés."""
+    table = {
+        'home': lambda rng: '/',
+        'about': lambda rng: '/about/',
+        'list': lambda rng: '/posts/',
+        'detail': lambda rng: f'/posts/bench-{rng.randrange(posts)}/',
+    }
+    if '--pagination' not in options or options[options.index('--pagination') + 1] == 'offset':
+        table['list_deep'] = lambda rng: f'/posts/?page={rng.randint(1, max(1, posts // 20))}'
+    if '--search' in options:
+        table['search'] = lambda rng: f'/posts/search/?q={rng.choice(WORDS)}'
+    return table
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Load-test a generated project seeded with N posts.",
+                                     epilog="Arguments after -- are passed to create_django_project.py.")
+    parser.add_argument('--posts', type=int, nargs='+', default=[1000],
+                        help="number of posts to benchmark with, e.g. 1000 100000 1000000 (default: 1000)")
+    parser.add_argument('--duration', type=float, default=10, help="seconds of load per route (default: 10)")
+    parser.add_argument('--warmup', type=float, default=2,
+                        help="seconds of unmeasured load per route before measuring (default: 2)")
+    parser.add_argument('--concurrency', type=int, default=8, help="parallel connections (default: 8)")
+    parser.add_argument('--output', help="JSON report file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    own_args, options = split_script_options(sys.argv[1:] if argv is None else argv)
+    args = parse_args(own_args)
+    if '--instrumentation' not in options:
+        options.append('--instrumentation')
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='djangoflow-bench-') as work_dir:
+        prepare_work_dir(work_dir)
+        scaffold(work_dir, options)
+        project_dir = os.path.join(work_dir, PROJECT_NAME)
+
+        seeded = 0
+        for posts in sorted(args.posts):
+            seed_time = seed_posts(project_dir, seeded, posts)
+            seeded = posts
+            print(f"{posts} posts seeded in {seed_time:.1f}s", file=sys.stderr)
+
+            port = free_port()
+            with open(os.path.join(work_dir, f'server-{posts}.log'), 'w') as log:
+                process, server = start_server(project_dir, port, log)
+                try:
+                    # runserver sends headers and body in two writes: on a kept-alive connection the
+                    # second one waits for the delayed ACK of the first (~40 ms with Nagle's algorithm)
+                    keep_alive = server != 'runserver'
+                    measured = {}
+                    for route, next_path in routes(posts, options).items():
+                        load(port, next_path, args.warmup, args.concurrency, keep_alive)
+                        measured[route] = load(port, next_path, args.duration, args.concurrency, keep_alive)
+                        print(f"  {route:<10} {measured[route]['throughput']:8.1f} req/s  "
+                              f"p50 {measured[route]['p50_ms']:.1f} ms  p99 {measured[route]['p99_ms']:.1f} ms",
+                              file=sys.stderr)
+                finally:
+                    stop_server(process)
+            results.append({'posts': posts, 'seed_seconds': seed_time, 'server': server, 'routes': measured})
+
+    write_report({
+        'benchmark': 'serve',
+        'environment': environment(),
+        'options': options,
+        'duration': args.duration,
+        'concurrency': args.concurrency,
+        'results': results,
+    }, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Compare le rendu de la liste des articles par les deux moteurs de templates : crée un projet
+avec --templates=jinja2 dans un dossier temporaire, y ajoute les templates Django de files/,
+puis rend posts/posts_list.html avec N articles par chacun des moteurs, dans l'environnement
+virtuel du projet.
+
+Les articles sont construits en mémoire (aucune requête SQL) et le cache est remplacé par
+DummyCache, pour que les deux moteurs rendent chaque carte au lieu de la relire en cache.
+Le rapport donne pour chaque taille la médiane et le minimum d'un rendu, et indique si les deux
+moteurs produisent le même HTML (espaces mis à part).
+
+Usage :
+    python benchmarks/bench_templates.py --items 10 100 1000 --repeat 200 --output templates.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from common import (PROJECT_NAME, REPO_DIR, environment, prepare_work_dir, scaffold, split_script_options,
+                    venv_python, write_report)
+
+# Programme exécuté par l'interpréteur du projet : reçoit la configuration en JSON (argv[1]),
+# écrit les résultats en JSON sur la sortie standard
+RENDER_SOURCE = r"""
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.getcwd())
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.template import engines
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from posts.models import Post
+
+config = json.loads(sys.argv[1])
+# Engines are created on first use: without debug information and template reloading, as in production
+settings.DEBUG = False
+origin = datetime(2024, 1, 1, tzinfo=timezone.utc)
+request = RequestFactory().get('/posts/')
+results = []
+
+with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}):
+    for items in config['items']:
+        posts = []
+        for i in range(items):
+            post = Post(id=i + 1, title=f"Post number {i}", slug=f"post-{i}", date=origin - timedelta(minutes=i),
+                        updated_at=origin)
+            post.excerpt = ('lorem ipsum <dolor> sit amet ' * 8)[:200]
+            posts.append(post)
+        page = Paginator(posts, items).page(1)
+        context = {'posts': page.object_list, 'page': page}
+
+        outputs = {}
+        for backend in config['backends']:
+            template = engines[backend].get_template('posts/posts_list.html')
+            html = template.render(context, request)
+            timings = []
+            for _ in range(config['repeat']):
+                start = time.perf_counter()
+                template.render(context, request)
+                timings.append(time.perf_counter() - start)
+            timings.sort()
+            outputs[backend] = ' '.join(html.split())
+            results.append({
+                'items': items,
+                'backend': backend,
+                'median_ms': timings[len(timings) // 2] * 1000,
+                'min_ms': timings[0] * 1000,
+                'bytes': len(html.encode()),
+            })
+        for result in results[-len(outputs):]:
+            result['same_output'] = len(set(outputs.values())) == 1
+
+print(json.dumps(results))
+"""
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Compare Django and Jinja2 rendering of the posts list.")
+    parser.add_argument('--items', type=int, nargs='+', default=[10, 100, 1000],
+                        help="numbers of posts rendered in the list (default: 10 100 1000)")
+    parser.add_argument('--repeat', type=int, default=200, help="renders measured per size and engine (default: 200)")
+    parser.add_argument('--output', help="JSON report file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def write_django_templates(project_dir):
+    """Écrit les templates Django de files/ dans templates/, à côté des templates Jinja2 du projet."""
+    sys.path.insert(0, REPO_DIR)
+    import djangoflow
+
+    djangoflow.write_template_set(os.path.join(project_dir, 'templates'))
+
+
+def main(argv=None):
+    own_args, options = split_script_options(sys.argv[1:] if argv is None else argv)
+    args = parse_args(own_args)
+    options = [option for option in options if not option.startswith('--templates')] + ['--templates', 'jinja2']
+
+    with tempfile.TemporaryDirectory(prefix='djangoflow-bench-') as work_dir:
+        prepare_work_dir(work_dir)
+        scaffold(work_dir, options)
+        project_dir = os.path.join(work_dir, PROJECT_NAME)
+        write_django_templates(project_dir)
+
+        config = {'items': sorted(args.items), 'repeat': args.repeat, 'backends': ['django', 'jinja2']}
+        result = subprocess.run([venv_python(project_dir), '-c', RENDER_SOURCE, json.dumps(config)], cwd=project_dir,
+                                stdout=subprocess.PIPE, text=True, check=True)
+        results = json.loads(result.stdout)
+
+    by_size = {}
+    for result in results:
+        by_size.setdefault(result['items'], {})[result['backend']] = result
+    for items, backends in sorted(by_size.items()):
+        speedup = backends['django']['median_ms'] / backends['jinja2']['median_ms']
+        print(f"  {items:>5} posts  django {backends['django']['median_ms']:8.2f} ms  "
+              f"jinja2 {backends['jinja2']['median_ms']:8.2f} ms  x{speedup:.1f}"
+              f"{'' if backends['jinja2']['same_output'] else '  (different HTML)'}", file=sys.stderr)
+
+    write_report({
+        'benchmark': 'templates',
+        'environment': environment(),
+        'options': options,
+        'repeat': args.repeat,
+        'results': results,
+    }, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Outils partagés par les benchmarks : génération d'un projet avec create_django_project.py
+dans un dossier temporaire et écriture des rapports JSON.
+"""
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_NAME = 'create_django_project.py'
+# Module importé par le script, qui contient le code (son bytecode est mis en cache)
+MODULE_NAME = 'djangoflow.py'
+PROJECT_NAME = 'my_project'
+
+
+def split_script_options(argv):
+    """Sépare les arguments du benchmark de ceux transmis au script, placés après ``--``."""
+    if '--' in argv:
+        index = argv.index('--')
+        return argv[:index], argv[index + 1:]
+    return argv, []
+
+
+def prepare_work_dir(work_dir):
+    """Copie le script, son module et files/ dans work_dir : le projet est créé dans le dossier courant du script."""
+    os.makedirs(work_dir, exist_ok=True)
+    shutil.copy(os.path.join(REPO_DIR, SCRIPT_NAME), work_dir)
+    shutil.copy(os.path.join(REPO_DIR, MODULE_NAME), work_dir)
+    shutil.copytree(os.path.join(REPO_DIR, 'files'), os.path.join(work_dir, 'files'), dirs_exist_ok=True)
+
+
+def scaffold(work_dir, options=(), cache_dir=None, timings_file=None):
+    """
+    Lance create_django_project.py dans work_dir, sa sortie allant dans work_dir/scaffold.log.
+
+    :param options: Options passées au script (``--search``, ``--async``...)
+    :param cache_dir: Cache de paquets à utiliser (``DJANGOFLOW_CACHE_DIR``), sinon celui de l'environnement
+    :param timings_file: Fichier où le script écrit la durée de chaque étape (``--timings-json``)
+    :return: Durée totale en secondes, démarrage de l'interpréteur compris
+    """
+    env = dict(os.environ)
+    if cache_dir:
+        env['DJANGOFLOW_CACHE_DIR'] = cache_dir
+    command = [sys.executable, SCRIPT_NAME, *options]
+    if timings_file:
+        command += ['--timings-json', timings_file]
+
+    log_path = os.path.join(work_dir, 'scaffold.log')
+    start = time.perf_counter()
+    with open(log_path, 'a') as log:
+        result = subprocess.run(command, cwd=work_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+    elapsed = time.perf_counter() - start
+    if result.returncode:
+        raise RuntimeError(f"{SCRIPT_NAME} exited with status {result.returncode}, see {log_path}")
+    return elapsed
+
+
+def venv_python(project_dir):
+    return os.path.join(project_dir, '.venv', 'bin', 'python')
+
+
+def environment():
+    """Ce qui distingue deux rapports : commit (et modifications locales), interpréteur, machine."""
+    def git(*args):
+        result = subprocess.run(['git', *args], cwd=REPO_DIR, capture_output=True, text=True)
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    commit = git('rev-parse', '--short', 'HEAD')
+    return {
+        'commit': commit,
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')) if commit else None,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def median(values):
+    values = sorted(values)
+    if not values:
+        return None
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def write_report(report, path=None):
+    """Écrit le rapport JSON dans path, ou sur la sortie standard."""
+    content = json.dumps(report, indent=2)
+    if path:
+        with open(path, 'w') as file:
+            file.write(content + '\n')
+        print(f"Report written to {path}", file=sys.stderr)
+    else:
+        print(content)
@@ -0,0 +1 @@
+// Scripts du site, chargés avec defer par layout.html
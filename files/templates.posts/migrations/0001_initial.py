@@ -1,22 +0,0 @@
-from django.db import migrations, models
-
-
-class Migration(migrations.Migration):
-
-    initial = True
-
-    dependencies = [
-    ]
-
-    operations = [
-        migrations.CreateModel(
-            name='Post',
-            fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('title', models.CharField(max_length=75)),
-                ('body', models.TextField()),
-                ('slug', models.SlugField()),
-                ('date', models.DateTimeField(auto_now_add=True)),
-            ],
-        ),
-    ]
\ No newline at end of file
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(REPO_DIR, 'create_django_project.py')
+
+# Cumulative import time of djangoflow, bytecode already cached (microseconds)
+IMPORT_TIME_BUDGET_US = 100_000
+
+# Modules that importing djangoflow must not load
+LAZY_MODULES = ['ast', 'colorama', 'concurrent.futures', 'django', 'platform', 'shutil', 'subprocess',
+                'urllib.parse']
+
+# Modules that --help and --plan must not load either: argparse imports shutil to format the help, and
+# --plan parses the database URLs written to settings.py (urllib.parse)
+CLI_LAZY_MODULES = ['ast', 'colorama', 'concurrent.futures', 'django', 'platform', 'subprocess']
+
+
+def run_python(*args, cwd=REPO_DIR, env=None):
+    env = dict(env or os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return subprocess.run([sys.executable, *args], cwd=cwd, env=env, capture_output=True, text=True, check=True)
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # The first import writes __pycache__, the timed ones read it
+        run_python('-c', 'import djangoflow')
+
+    def test_import_time_budget(self):
+        timings = []
+        for _ in range(3):
+            result = run_python('-X', 'importtime', '-c', 'import djangoflow')
+            line = next(line for line in result.stderr.splitlines() if line.endswith('| djangoflow'))
+            timings.append(int(line.split('|')[1]))
+        self.assertLess(min(timings), IMPORT_TIME_BUDGET_US, result.stderr)
+
+    def test_heavy_modules_are_lazy(self):
+        code = 'import sys, djangoflow; print(" ".join(sorted(sys.modules)))'
+        loaded = set(run_python('-c', code).stdout.split())
+        self.assertEqual([name for name in LAZY_MODULES if name in loaded], [])
+
+
+class StartupTest(unittest.TestCase):
+    """Lance le script comme un utilisateur (``py create_django_project.py ...``) dans un dossier vide."""
+
+    def setUp(self):
+        work_dir = tempfile.TemporaryDirectory(prefix='djangoflow-test-')
+        self.addCleanup(work_dir.cleanup)
+        self.work_dir = work_dir.name
+        self.env = dict(os.environ, DJANGOFLOW_CACHE_DIR=os.path.join(self.work_dir, 'cache'), PYTHONPATH=REPO_DIR)
+
+    def loaded_modules(self, *args):
+        # main() runs as in the script; the modules are listed even when --help exits
+        code = ('import sys, djangoflow\n'
+                'try:\n'
+                '    djangoflow.main(sys.argv[1:])\n'
+                'finally:\n'
+                '    print(" ".join(sorted(sys.modules)), file=sys.stderr)')
+        return set(run_python('-c', code, *args, cwd=self.work_dir, env=self.env).stderr.split())
+
+    def test_script_import_time_budget(self):
+        run_python(SCRIPT, '--help', cwd=self.work_dir, env=self.env)
+        result = run_python('-X', 'importtime', SCRIPT, '--help', cwd=self.work_dir, env=self.env)
+        line = next(line for line in result.stderr.splitlines() if line.endswith('| djangoflow'))
+        self.assertLess(int(line.split('|')[1]), IMPORT_TIME_BUDGET_US, result.stderr)
+
+    def test_help_loads_no_heavy_module(self):
+        loaded = self.loaded_modules('--help')
+        self.assertEqual([name for name in CLI_LAZY_MODULES if name in loaded], [])
+
+    def test_plan_loads_no_heavy_module(self):
+        loaded = self.loaded_modules('--plan', '--target-dir', self.work_dir)
+        self.assertEqual([name for name in CLI_LAZY_MODULES if name in loaded], [])
+        # --plan only prints: the project directory is not created
+        self.assertFalse(os.path.exists(os.path.join(self.work_dir, 'my_project')))
+
+
+if __name__ == '__main__':
+    unittest.main()
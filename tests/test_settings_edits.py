@@ -0,0 +1,259 @@
+import os
+import sys
+import unittest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import djangoflow  # noqa: E402
+
+# settings.py as written by `django-admin startproject core` (docstrings and password validators trimmed)
+STARTPROJECT_SETTINGS = b'''"""
+Django settings for core project.
+"""
+
+from pathlib import Path
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = 'django-insecure-test'
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = True
+
+ALLOWED_HOSTS = []
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'core.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'core.wsgi.application'
+
+
+# Database
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+    }
+}
+
+
+# Static files (CSS, JavaScript, Images)
+
+STATIC_URL = 'static/'
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+'''
+
+
+def load_settings(source):
+    """Exécute un settings.py et renvoie ses réglages."""
+    namespace = {'__file__': '/project/core/settings.py'}
+    exec(compile(source, 'settings.py', 'exec'), namespace)
+    return namespace
+
+
+class SettingsEditsTest(unittest.TestCase):
+
+    def apply(self, edits, source=STARTPROJECT_SETTINGS):
+        return djangoflow.apply_settings_edits(source, edits)
+
+    def test_set_replaces_existing_value(self):
+        settings = load_settings(self.apply([djangoflow.set_setting('ALLOWED_HOSTS', "['127.0.0.1']")]))
+        self.assertEqual(settings['ALLOWED_HOSTS'], ['127.0.0.1'])
+
+    def test_set_nested_value(self):
+        settings = load_settings(self.apply([djangoflow.set_setting(('TEMPLATES', 0, 'APP_DIRS'), 'False')]))
+        self.assertIs(settings['TEMPLATES'][0]['APP_DIRS'], False)
+
+    def test_set_missing_setting_is_added_at_the_end(self):
+        result = self.apply([djangoflow.set_setting('CONN_MAX_AGE', '60')])
+        self.assertTrue(result.endswith(b'CONN_MAX_AGE = 60\n'))
+        self.assertEqual(load_settings(result)['CONN_MAX_AGE'], 60)
+
+    def test_set_missing_key_is_added_to_parent_dict(self):
+        result = self.apply([djangoflow.set_setting(('TEMPLATES', 0, 'OPTIONS', 'debug'), 'True')])
+        options = load_settings(result)['TEMPLATES'][0]['OPTIONS']
+        self.assertIs(options['debug'], True)
+        self.assertIn('context_processors', options)
+
+    def test_missing_parent_raises(self):
+        with self.assertRaises(ValueError):
+            self.apply([djangoflow.set_setting(('CACHES', 'default', 'TIMEOUT'), '300')])
+
+    def test_set_and_extend_same_setting_raises(self):
+        with self.assertRaises(ValueError):
+            self.apply([djangoflow.set_setting('MIDDLEWARE', '[]'),
+                        djangoflow.append_to_setting('MIDDLEWARE', "'a.Middleware'")])
+
+    def test_append(self):
+        settings = load_settings(self.apply(djangoflow.POSTS_APP_EDITS))
+        self.assertEqual(settings['INSTALLED_APPS'][-1], 'posts')
+
+    def test_append_to_nested_list(self):
+        result = self.apply([djangoflow.append_to_setting(('TEMPLATES', 0, 'DIRS'), "BASE_DIR / 'templates'")])
+        self.assertEqual([str(path) for path in load_settings(result)['TEMPLATES'][0]['DIRS']], ['/project/templates'])
+
+    def test_append_to_missing_setting_creates_list(self):
+        result = self.apply([djangoflow.append_to_setting('STATICFILES_DIRS', "BASE_DIR / 'static'")])
+        self.assertEqual([str(path) for path in load_settings(result)['STATICFILES_DIRS']], ['/project/static'])
+
+    def test_prepend(self):
+        settings = load_settings(self.apply([djangoflow.prepend_to_setting('MIDDLEWARE', "'a.Middleware'")]))
+        self.assertEqual(settings['MIDDLEWARE'][:2], ['a.Middleware', 'django.middleware.security.SecurityMiddleware'])
+
+    def test_several_prepends_keep_their_order(self):
+        edits = [djangoflow.prepend_to_setting('MIDDLEWARE', f"'{name}'") for name in ('a.First', 'b.Second', 'c.Third')]
+        settings = load_settings(self.apply(edits))
+        self.assertEqual(settings['MIDDLEWARE'][:4],
+                         ['a.First', 'b.Second', 'c.Third', 'django.middleware.security.SecurityMiddleware'])
+
+    def test_middleware_order_of_project_options(self):
+        options = djangoflow.ProjectOptions(instrumentation=True, cache='locmem', cache_middleware=True,
+                                            compression='brotli', minify_html=True)
+        middleware = load_settings(self.apply(djangoflow.project_settings_edits(options)))['MIDDLEWARE']
+        self.assertEqual(middleware[:4], [
+            'core.instrumentation.RequestTimingMiddleware',
+            'django.middleware.cache.UpdateCacheMiddleware',
+            'core.compression.CompressionMiddleware',
+            'django.middleware.security.SecurityMiddleware',
+        ])
+        self.assertEqual(middleware[-2:], ['django.middleware.cache.FetchFromCacheMiddleware',
+                                           'core.compression.HtmlMinifyMiddleware'])
+
+    def test_insert_after(self):
+        edit = djangoflow.insert_after_in_setting('MIDDLEWARE', "'django.middleware.security.SecurityMiddleware'",
+                                                  "'whitenoise.middleware.WhiteNoiseMiddleware'")
+        settings = load_settings(self.apply([edit]))
+        self.assertEqual(settings['MIDDLEWARE'][1], 'whitenoise.middleware.WhiteNoiseMiddleware')
+
+    def test_insert_after_missing_anchor_appends(self):
+        edit = djangoflow.insert_after_in_setting('MIDDLEWARE', "'missing.Middleware'", "'a.Middleware'")
+        self.assertEqual(load_settings(self.apply([edit]))['MIDDLEWARE'][-1], 'a.Middleware')
+
+    def test_import(self):
+        result = self.apply([djangoflow.add_import('import os')])
+        self.assertEqual(result.count(b'import os\n'), 1)
+        self.assertLess(result.index(b'import os\n'), result.index(b'from pathlib import Path'))
+
+    def test_existing_import_is_not_added(self):
+        result = self.apply([djangoflow.add_import('from pathlib import Path')])
+        self.assertEqual(result, STARTPROJECT_SETTINGS)
+
+    def test_comments_and_formatting_are_kept(self):
+        result = self.apply(djangoflow.ALLOWED_HOSTS_EDITS + djangoflow.POSTS_APP_EDITS)
+        self.assertIn(b"# SECURITY WARNING: don't run with debug turned on in production!\n", result)
+        self.assertIn(b"    'django.contrib.staticfiles',\n", result)
+
+    def test_edits_are_idempotent(self):
+        edits = djangoflow.project_settings_edits(djangoflow.ProjectOptions(
+            instrumentation=True, cache='locmem', cache_middleware=True, compression='gzip', minify_html=True,
+        )) + djangoflow.asset_settings_edits()
+        once = self.apply(edits)
+        self.assertEqual(self.apply(edits, once), once)
+        self.assertEqual(load_settings(once)['INSTALLED_APPS'].count('posts'), 1)
+
+    def test_duplicate_edits_in_one_batch_apply_once(self):
+        settings = load_settings(self.apply(djangoflow.POSTS_APP_EDITS * 2))
+        self.assertEqual(settings['INSTALLED_APPS'].count('posts'), 1)
+
+
+class SettingsSplicesTest(unittest.TestCase):
+    """Un helper splice_* par action de SettingsEdit, appliqué directement à un SettingsPatch."""
+
+    SOURCE = b"""import os
+
+MIDDLEWARE = [
+    'a.First',  # kept
+    'b.Second',
+]
+ALLOWED_HOSTS = ['old']  # trailing comment
+OPTIONS = {'debug': False}
+"""
+
+    def splice(self, splice, *args):
+        patch = djangoflow.SettingsPatch(self.SOURCE)
+        splice(patch, *args)
+        return patch.result()
+
+    def test_splice_imports(self):
+        result = self.splice(djangoflow.splice_imports, ['import os', 'import sys'])
+        self.assertTrue(result.startswith(b'import sys\nimport os\n'))
+
+    def test_splice_set(self):
+        result = self.splice(djangoflow.splice_set, ('ALLOWED_HOSTS',), "['new']")
+        self.assertIn(b"ALLOWED_HOSTS = ['new']  # trailing comment\n", result)
+
+    def test_splice_set_new_key(self):
+        result = self.splice(djangoflow.splice_set, ('OPTIONS', 'timeout'), '5')
+        self.assertIn(b"OPTIONS = {'debug': False, 'timeout': 5}", result)
+
+    def test_splice_set_drops_comments_inside_the_value(self):
+        result = self.splice(djangoflow.splice_set, ('MIDDLEWARE',), "['c.Third']")
+        self.assertNotIn(b'# kept', result)
+        self.assertEqual(load_settings(result)['MIDDLEWARE'], ['c.Third'])
+
+    def test_splice_append(self):
+        result = self.splice(djangoflow.splice_append, ('MIDDLEWARE',), ["'c.Third'", "'a.First'"])
+        self.assertIn(b"    'a.First',  # kept\n", result)
+        self.assertEqual(load_settings(result)['MIDDLEWARE'], ['a.First', 'b.Second', 'c.Third'])
+
+    def test_splice_prepend(self):
+        result = self.splice(djangoflow.splice_prepend, ('MIDDLEWARE',), ["'y.One'", "'z.Two'"])
+        self.assertIn(b"    'a.First',  # kept\n", result)
+        self.assertEqual(load_settings(result)['MIDDLEWARE'], ['y.One', 'z.Two', 'a.First', 'b.Second'])
+
+    def test_splice_insert_after(self):
+        result = self.splice(djangoflow.splice_insert_after, ('MIDDLEWARE',), [("'a.First'", "'c.Third'")])
+        self.assertEqual(load_settings(result)['MIDDLEWARE'], ['a.First', 'c.Third', 'b.Second'])
+
+    def test_splice_into_missing_list_creates_it(self):
+        result = self.splice(djangoflow.splice_append, ('STATICFILES_DIRS',), ["'static'"])
+        self.assertEqual(load_settings(result)['STATICFILES_DIRS'], ['static'])
+
+    def test_splice_into_non_list_raises(self):
+        with self.assertRaises(ValueError):
+            self.splice(djangoflow.splice_append, ('OPTIONS',), ["'x'"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import djangoflow  # noqa: E402
+
+PACKAGE_STEPS = ['package_cache', 'venv', 'install_django', 'install_compressor', 'install_extras']
+# Steps that run django.setup() in the worker (startproject and startapp run without settings)
+DJANGO_STEP_FUNCTIONS = [djangoflow.execute_django_migrations, djangoflow.create_superuser,
+                         djangoflow.collect_static_files]
+
+
+def noop():
+    pass
+
+
+class StepFingerprintTest(unittest.TestCase):
+
+    def setUp(self):
+        work_dir = tempfile.TemporaryDirectory(prefix='djangoflow-test-')
+        self.addCleanup(work_dir.cleanup)
+        djangoflow.configure_project('my_project', work_dir.name)
+
+    def fingerprints(self, offline=False, **options):
+        steps = djangoflow.build_setup_steps(offline=offline, options=djangoflow.ProjectOptions(**options))
+        return {step.name: djangoflow.step_fingerprint(step) for step in steps}
+
+    def changed(self, before, after):
+        return sorted(name for name in before if before[name] != after.get(name))
+
+    def test_offline_is_not_an_input(self):
+        self.assertEqual(self.fingerprints(offline=True), self.fingerprints())
+
+    def test_cache_location_is_not_an_input(self):
+        before = self.fingerprints()
+        with mock.patch.object(djangoflow, 'CACHE_DIR', '/elsewhere'):
+            self.assertEqual(self.fingerprints(), before)
+
+    def test_template_option_leaves_package_steps_alone(self):
+        self.assertEqual(self.changed(self.fingerprints(), self.fingerprints(page_size=30)), ['posts_views'])
+
+    def test_requirement_change_only_reaches_cache_and_extras(self):
+        changed = self.changed(self.fingerprints(compression='gzip'), self.fingerprints(compression='brotli'))
+        self.assertEqual([name for name in changed if name in PACKAGE_STEPS], ['install_extras', 'package_cache'])
+
+
+class SetupStepsTest(unittest.TestCase):
+
+    def test_django_steps_never_overlap_settings_writers(self):
+        # A step that boots Django in the worker must not read settings.py while another step rewrites it
+        for options in (djangoflow.ProjectOptions(), djangoflow.ProjectOptions(production_assets=True)):
+            steps = djangoflow.build_setup_steps(options=options)
+            by_name = {step.name: step for step in steps}
+            ancestors = {}
+            for step in (by_name[name] for name in djangoflow.check_steps(steps)):
+                ancestors[step.name] = set()
+                for dependency in [*step.requires, *step.after]:
+                    ancestors[step.name] |= {dependency} | ancestors[dependency]
+            writers = [step.name for step in steps if 'core/settings.py' in step.outputs]
+            django_steps = [step.name for step in steps
+                            if getattr(step.func, 'func', step.func) in DJANGO_STEP_FUNCTIONS]
+            for name in django_steps:
+                for writer in writers:
+                    with self.subTest(step=name, writer=writer):
+                        self.assertTrue(writer in ancestors[name] or name in ancestors[writer])
+
+
+class PlanStepsTest(unittest.TestCase):
+
+    def setUp(self):
+        work_dir = tempfile.TemporaryDirectory(prefix='djangoflow-test-')
+        self.addCleanup(work_dir.cleanup)
+        djangoflow.configure_project('my_project', work_dir.name)
+
+    def plan(self, steps, changed):
+        manifest = {'steps': {}, 'artifacts': {}}
+        for step in steps:
+            fingerprint = 'old' if step.name in changed else djangoflow.step_fingerprint(step)
+            manifest['steps'][step.name] = {'fingerprint': fingerprint}
+        reasons, _ = djangoflow.plan_steps(steps, manifest)
+        return sorted(name for name, reason in reasons.items() if reason)
+
+    def test_requires_reruns_dependents(self):
+        steps = [djangoflow.Step('cache', [], noop), djangoflow.Step('venv', ['cache'], noop)]
+        self.assertEqual(self.plan(steps, {'cache'}), ['cache', 'venv'])
+
+    def test_after_only_orders(self):
+        steps = [djangoflow.Step('cache', [], noop), djangoflow.Step('venv', [], noop, after=['cache'])]
+        self.assertEqual(self.plan(steps, {'cache'}), ['cache'])
+        self.assertEqual(djangoflow.check_steps(steps), ['cache', 'venv'])
+
+    def test_unknown_after_step_raises(self):
+        with self.assertRaises(ValueError):
+            djangoflow.check_steps([djangoflow.Step('venv', [], noop, after=['cache'])])
+
+
+if __name__ == '__main__':
+    unittest.main()